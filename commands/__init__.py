@@ -0,0 +1,14 @@
+"""
+명령어 패키지
+각 명령어 모듈이 프로젝트 루트 기준 절대 임포트를 사용할 수 있도록
+경로 설정을 패키지 로드 시 한 번만 수행합니다.
+"""
+
+import os
+import sys
+
+# 경로 설정 (VM 환경 대응) - 중복 추가 방지
+_here = os.path.dirname(os.path.abspath(__file__))
+for _path in (_here, os.path.join(_here, '..')):
+    if _path not in sys.path:
+        sys.path.append(_path)
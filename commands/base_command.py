@@ -11,9 +11,11 @@ from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional, Tuple, Union, Callable
 from datetime import datetime
 
-# 경로 설정 (VM 환경 대응)
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+# 경로 설정 (VM 환경 대응) - 스크립트로 직접 실행되는 경우를 위해 중복 없이 추가
+_here = os.path.dirname(os.path.abspath(__file__))
+for _path in (_here, os.path.join(_here, '..')):
+    if _path not in sys.path:
+        sys.path.append(_path)
 
 try:
     from config.settings import config
@@ -135,6 +137,9 @@ class BaseCommand(ABC):
     효율적인 사용자 관리 및 에러 처리를 적용합니다.
     """
     
+    # 실행 시 시트의 사용자 정보가 필요한지 여부 (False면 라우터가 사용자 조회를 생략)
+    requires_user = True
+    
     def __init__(self, sheets_manager: Optional[SheetsManager] = None):
         """
         BaseCommand 초기화
@@ -4,16 +4,10 @@
 새로운 BaseCommand 구조와 최적화된 에러 핸들링을 적용합니다.
 """
 
-import os
-import sys
 import random
 import re
 from typing import List, Tuple, Any, Optional, Dict
 
-# 경로 설정 (VM 환경 대응)
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
-
 try:
     from config.settings import config
     from utils.logging_config import logger, bot_logger
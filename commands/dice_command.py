@@ -4,15 +4,9 @@
 새로운 BaseCommand 구조와 최적화된 에러 핸들링을 적용합니다.
 """
 
-import os
-import sys
 import random
 import re
-from typing import List, Tuple, Any, Optional, Dict
-
-# 경로 설정 (VM 환경 대응)
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from typing import List, Tuple, Any, Optional, Dict, Iterator
 
 try:
     from config.settings import config
@@ -58,6 +52,17 @@ except ImportError as e:
                 setattr(self, key, value)
 
 
+# 기본 다이스 패턴: 숫자d숫자[</>숫자]
+_DICE_SIMPLE_RE = re.compile(r'^\d+[dD]\d+([<>]\d+)?$')
+
+# 텍스트 내 다이스 표현식 추출용 패턴 (전체 표현식을 얻기 위해 비캡처 그룹 사용)
+_DICE_EXTRACT_RE = re.compile(r'\b\d+[dD]\d+(?:[<>]\d+)?\b')
+
+# 복수 주사위 결과 메시지 템플릿
+_THRESHOLD_MESSAGE_FORMAT = "{rolls}\n성공 주사위: {success}개\n실패 주사위: {fail}개입니다."
+_TOTAL_MESSAGE_FORMAT = "{rolls}\n합계: {total}"
+
+
 class DiceCommand(BaseCommand):
     """
     최적화된 다이스 굴리기 명령어 클래스
@@ -70,6 +75,9 @@ class DiceCommand(BaseCommand):
     - [1d6] : 직접 다이스 표현식 (다이스 키워드 없이)
     """
     
+    # 사용자 정보를 사용하지 않음
+    requires_user = False
+    
     def _get_command_type(self) -> CommandType:
         """명령어 타입 반환"""
         return CommandType.DICE
@@ -161,9 +169,12 @@ class DiceCommand(BaseCommand):
         Returns:
             bool: 다이스 표현식 여부
         """
-        # 기본 다이스 패턴: 숫자d숫자[</>숫자]
-        dice_pattern = re.compile(r'^\d+[dD]\d+([<>]\d+)?$')
-        return bool(dice_pattern.match(expression))
+        # 정규식 전에 값싼 문자열 검사로 명백히 아닌 입력을 걸러냄
+        if not expression or not expression[0].isdigit():
+            return False
+        if 'd' not in expression and 'D' not in expression:
+            return False
+        return _DICE_SIMPLE_RE.match(expression) is not None
     
     def _parse_dice_expression(self, dice_expression: str) -> Dict[str, Any]:
         """
@@ -315,28 +326,25 @@ class DiceCommand(BaseCommand):
         Returns:
             str: 포맷된 결과 메시지
         """
-        if len(dice_result.rolls) == 1:
-            # 단일 주사위
-            if dice_result.has_threshold:
-                # 성공/실패 조건이 있는 경우
-                success = dice_result.is_success
-                if success is not None:
-                    return f"{dice_result.rolls[0]}"
-                else:
-                    return f"{dice_result.rolls[0]}"
-            else:
-                # 일반 단일 주사위
-                return f"{dice_result.rolls[0]}"
-        else:
-            # 복수 주사위
-            rolls_str = ", ".join(str(roll) for roll in dice_result.rolls)
-            
-            if dice_result.has_threshold:
-                # 성공/실패 조건이 있는 경우
-                return f"{rolls_str}\n성공 주사위: {dice_result.success_count}개\n실패 주사위: {dice_result.fail_count}개입니다."
-            else:
-                # 일반 복수 주사위
-                return f"{rolls_str}\n합계: {dice_result.total}"
+        rolls = dice_result.rolls
+        
+        # 단일 주사위 (성공/실패 조건과 관계없이 굴린 값만 표시)
+        if len(rolls) == 1:
+            return str(rolls[0])
+        
+        # 복수 주사위
+        rolls_str = ", ".join(map(str, rolls))
+        
+        if dice_result.has_threshold:
+            # 성공/실패 조건이 있는 경우
+            return _THRESHOLD_MESSAGE_FORMAT.format(
+                rolls=rolls_str,
+                success=dice_result.success_count,
+                fail=dice_result.fail_count
+            )
+        
+        # 일반 복수 주사위
+        return _TOTAL_MESSAGE_FORMAT.format(rolls=rolls_str, total=dice_result.total)
     
     def get_help_text(self) -> str:
         """도움말 텍스트 반환"""
@@ -466,8 +474,7 @@ def is_dice_command(keyword: str) -> bool:
         return True
     
     # 직접 다이스 표현식 (예: "2d6", "1d100<50")
-    dice_pattern = re.compile(r'^\d+[dD]\d+([<>]\d+)?$')
-    return bool(dice_pattern.match(keyword))
+    return _DICE_SIMPLE_RE.match(keyword) is not None
 
 
 def extract_dice_from_text(text: str) -> List[str]:
@@ -480,8 +487,23 @@ def extract_dice_from_text(text: str) -> List[str]:
     Returns:
         List[str]: 발견된 다이스 표현식들
     """
-    dice_pattern = re.compile(r'\b\d+[dD]\d+([<>]\d+)?\b')
-    return dice_pattern.findall(text)
+    return [match.group(0) for match in _DICE_EXTRACT_RE.finditer(text)]
+
+
+def iter_dice_from_text(text: str) -> Iterator[str]:
+    """
+    텍스트에서 다이스 표현식들을 순차적으로 추출 (제너레이터)
+    
+    한 번만 순회하는 경우 리스트를 만들지 않고 사용할 수 있습니다.
+    
+    Args:
+        text: 분석할 텍스트
+        
+    Yields:
+        str: 발견된 다이스 표현식
+    """
+    for match in _DICE_EXTRACT_RE.finditer(text):
+        yield match.group(0)
 
 
 def validate_dice_expression(expression: str) -> Tuple[bool, str]:
@@ -4,17 +4,11 @@
 새로운 BaseCommand 구조와 최적화된 에러 핸들링을 적용합니다.
 """
 
-import os
-import sys
 import random
 from typing import List, Tuple, Any, Optional, Dict
 from datetime import datetime, date
 import hashlib
 
-# 경로 설정 (VM 환경 대응)
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
-
 try:
     from config.settings import config
     from utils.logging_config import logger, bot_logger
@@ -106,12 +100,12 @@ class FortuneCommand(BaseCommand):
             FortuneError: 운세 데이터 로드 실패
         """
         # 오늘 이미 운세를 확인했는지 체크
-        today_fortune = self._get_today_fortune_cache(user.id)
-        if today_fortune:
+        cached = self._get_today_fortune_cache(user.id)
+        if cached:
             logger.debug(f"캐시된 오늘의 운세 반환: {user.id}")
-            fortune_result = create_fortune_result(today_fortune, user.get_display_name())
-            message = self._format_result_message(fortune_result)
-            return message, fortune_result
+            fortune_text, message = cached
+            # 포맷된 메시지를 그대로 재사용 (조사 처리/포맷팅 생략)
+            return message, create_fortune_result(fortune_text, user.get_display_name())
         
         # 운세 문구 로드
         fortune_phrases = self._load_fortune_phrases()
@@ -122,15 +116,15 @@ class FortuneCommand(BaseCommand):
         # 사용자와 날짜 기반으로 일관된 운세 선택
         selected_fortune = self._select_consistent_fortune(user.id, fortune_phrases)
         
-        # 오늘의 운세 캐시에 저장
-        self._cache_today_fortune(user.id, selected_fortune)
-        
         # 결과 객체 생성
         fortune_result = create_fortune_result(selected_fortune, user.get_display_name())
         
         # 결과 메시지 생성
         message = self._format_result_message(fortune_result)
         
+        # 오늘의 운세 캐시에 저장 (포맷된 메시지까지 함께 저장)
+        self._cache_today_fortune(user.id, selected_fortune, message)
+        
         return message, fortune_result
     
     def _load_fortune_phrases(self) -> List[str]:
@@ -141,7 +135,7 @@ class FortuneCommand(BaseCommand):
             List[str]: 운세 문구 리스트
         """
         # 캐시에서 먼저 조회
-        cached_phrases = bot_cache.get_fortune_phrases()
+        cached_phrases = bot_cache.get("fortune_phrases")
         if cached_phrases:
             logger.debug("캐시에서 운세 문구 로드")
             return cached_phrases
@@ -152,7 +146,7 @@ class FortuneCommand(BaseCommand):
                 phrases = self.sheets_manager.get_fortune_phrases()
                 if phrases:
                     # 캐시에 저장 (설정된 TTL 사용)
-                    bot_cache.cache_fortune_phrases(phrases)
+                    bot_cache.set("fortune_phrases", phrases, config.FORTUNE_CACHE_TTL)
                     logger.debug(f"시트에서 운세 문구 로드: {len(phrases)}개")
                     return phrases
         except Exception as e:
@@ -197,7 +191,7 @@ class FortuneCommand(BaseCommand):
         today = date.today().isoformat()
         return f"fortune_today_{user_id}_{today}"
     
-    def _get_today_fortune_cache(self, user_id: str) -> Optional[str]:
+    def _get_today_fortune_cache(self, user_id: str) -> Optional[Tuple[str, str]]:
         """
         오늘의 운세 캐시 조회
         
@@ -205,22 +199,25 @@ class FortuneCommand(BaseCommand):
             user_id: 사용자 ID
             
         Returns:
-            Optional[str]: 캐시된 운세 또는 None
+            Optional[Tuple[str, str]]: 캐시된 (운세 문구, 결과 메시지) 또는 None
         """
         cache_key = self._get_today_fortune_cache_key(user_id)
         return bot_cache.general_cache.get(cache_key)
     
-    def _cache_today_fortune(self, user_id: str, fortune: str) -> None:
+    def _cache_today_fortune(self, user_id: str, fortune: str, message: str) -> None:
         """
         오늘의 운세 캐시 저장
         
+        캐시 히트 시 메시지 포맷팅을 다시 하지 않도록 포맷된 메시지를 함께 저장합니다.
+        
         Args:
             user_id: 사용자 ID
             fortune: 운세 문구
+            message: 포맷된 결과 메시지
         """
         cache_key = self._get_today_fortune_cache_key(user_id)
         # 하루 동안 캐시 (86400초)
-        bot_cache.general_cache.set(cache_key, fortune, ttl=86400)
+        bot_cache.general_cache.set(cache_key, (fortune, message), ttl=86400)
         logger.debug(f"오늘의 운세 캐시 저장: {user_id}")
     
     def _format_result_message(self, fortune_result: FortuneResult) -> str:
@@ -283,7 +280,7 @@ class FortuneCommand(BaseCommand):
                 'sheet_phrases_count': sheet_phrases,
                 'default_phrases_count': len(self.DEFAULT_FORTUNES),
                 'using_default_fortunes': using_default,
-                'cache_available': bot_cache.get_fortune_phrases() is not None,
+                'cache_available': bot_cache.get("fortune_phrases") is not None,
                 'cache_ttl': config.FORTUNE_CACHE_TTL
             }
             
@@ -406,7 +403,7 @@ class FortuneCommand(BaseCommand):
             results['info']['default_phrases_count'] = len(self.DEFAULT_FORTUNES)
             
             # 캐시 상태 확인
-            cached_phrases = bot_cache.get_fortune_phrases()
+            cached_phrases = bot_cache.get("fortune_phrases")
             results['info']['cache_available'] = cached_phrases is not None
             if cached_phrases:
                 results['info']['cached_phrases_count'] = len(cached_phrases)
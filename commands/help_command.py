@@ -4,14 +4,11 @@ Google Sheets에서 도움말 정보를 가져와 표시하는 명령어 클래
 새로운 BaseCommand 구조와 최적화된 에러 핸들링을 적용합니다.
 """
 
-import os
-import sys
+import threading
+import time
+from collections import Counter
 from typing import List, Tuple, Any, Optional, Dict
 
-# 경로 설정 (VM 환경 대응)
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
-
 try:
     from config.settings import config
     from utils.logging_config import logger, bot_logger
@@ -71,6 +68,9 @@ class HelpCommand(BaseCommand):
     - [도움말] : 모든 명령어 도움말 표시
     """
     
+    # 사용자 정보를 사용하지 않음
+    requires_user = False
+    
     # 기본 도움말 내용 (시트 로드 실패 시 사용)
     DEFAULT_HELP = """자동봇 답변의 공개 범위는 명령어를 포함한 멘션의 공개 범위를 따릅니다.
 
@@ -82,6 +82,26 @@ class HelpCommand(BaseCommand):
 [운세] - 오늘의 운세를 볼 수 있습니다.
 [도움말] - 도움말을 보여줍니다."""
     
+    # 기본 도움말에 포함된 명령어 개수
+    _DEFAULT_HELP_COMMAND_COUNT = 6
+    
+    # 시트 도움말 앞에 붙는 안내 문구
+    _BASE_MESSAGE = (
+        "자동봇 답변의 공개 범위는 명령어를 포함한 멘션의 공개 범위를 따릅니다.\n"
+        "사용 가능한 명령어는 다음과 같습니다.\n\n"
+    )
+    
+    # 도움말 항목 캐시 갱신 주기 및 만료 후 이전 값 보관 기간 (초)
+    HELP_ITEMS_TTL = 3600
+    HELP_ITEMS_STALE_TTL = 86400
+    
+    # 갱신 실패 후 다음 백그라운드 갱신까지 기다리는 시간 (초)
+    HELP_ITEMS_RETRY_INTERVAL = 60
+    
+    # 백그라운드 갱신 중복 실행 방지 및 다음 갱신 시도 가능 시각
+    _refresh_lock = threading.Lock()
+    _next_refresh_at = 0.0
+    
     def _get_command_type(self) -> CommandType:
         """명령어 타입 반환"""
         return CommandType.HELP
@@ -101,78 +121,149 @@ class HelpCommand(BaseCommand):
         Returns:
             Tuple[str, HelpResult]: (결과 메시지, 도움말 결과 객체)
         """
-        # 도움말 내용 생성
-        help_text = self._generate_help_text()
-        
-        # 명령어 개수 계산
-        command_count = self._count_commands_in_help(help_text)
+        # 도움말 내용 및 명령어 개수 생성
+        help_text, command_count = self._generate_help_text()
         
         # 결과 객체 생성
         help_result = create_help_result(help_text, command_count)
         
         return help_text, help_result
     
-    def _generate_help_text(self) -> str:
+    def _generate_help_text(self) -> Tuple[str, int]:
         """
         도움말 텍스트 생성
         
         Returns:
-            str: 완성된 도움말 텍스트
+            Tuple[str, int]: (완성된 도움말 텍스트, 명령어 개수)
         """
-        # 도움말 항목 로드
-        help_items = self._load_help_items()
+        # 도움말 항목 로드 (캐시 항목의 갱신 시각을 렌더링 캐시 키로 사용)
+        items_key, help_items = self._load_help_items_entry()
         
         if not help_items:
             logger.info("시트 도움말 없음, 기본 도움말 사용")
-            return self.DEFAULT_HELP
+            return self.DEFAULT_HELP, self._DEFAULT_HELP_COMMAND_COUNT
         
-        # 도움말 텍스트 구성
-        base_message = (
-            "자동봇 답변의 공개 범위는 명령어를 포함한 멘션의 공개 범위를 따릅니다.\n"
-            "사용 가능한 명령어는 다음과 같습니다.\n\n"
-        )
+        # 같은 항목으로 이미 렌더링한 텍스트가 있으면 재사용
+        # (항목이 새로 로드될 때마다 만료 시각이 바뀌므로 항목을 훑지 않고 비교 가능)
+        rendered = bot_cache.get("help_text_rendered")
+        if rendered and rendered[0] == items_key:
+            logger.debug("캐시에서 렌더링된 도움말 로드")
+            return rendered[1], rendered[2]
         
         # 도움말 항목들을 문자열로 변환
-        help_lines = []
-        for item in help_items:
-            command = item.get('명령어', '').strip()
-            description = item.get('설명', '').strip()
-            
-            if command and description:
-                help_lines.append(f"{command} - {description}")
+        help_lines = [
+            f"{command} - {description}"
+            for command, description in (
+                (item.get('명령어', '').strip(), item.get('설명', '').strip())
+                for item in help_items
+            )
+            if command and description
+        ]
         
         if not help_lines:
             logger.warning("유효한 도움말 항목 없음, 기본 도움말 사용")
-            return self.DEFAULT_HELP
+            return self.DEFAULT_HELP, self._DEFAULT_HELP_COMMAND_COUNT
+        
+        help_text = self._BASE_MESSAGE + "\n".join(help_lines)
+        command_count = len(help_lines)
         
-        help_content = "\n".join(help_lines)
-        return base_message + help_content
+        # 렌더링 결과 캐시 (1시간)
+        bot_cache.set("help_text_rendered", (items_key, help_text, command_count), 3600)
+        return help_text, command_count
     
     def _load_help_items(self) -> List[Dict[str, str]]:
+        """도움말 항목 로드 (stale-while-revalidate)"""
+        return self._load_help_items_entry()[1]
+    
+    def _load_help_items_entry(self) -> Tuple[float, List[Dict[str, str]]]:
         """
-        도움말 항목 로드 (수정된 버전)
+        도움말 캐시 항목 로드 (stale-while-revalidate)
+        
+        캐시가 만료된 경우에도 이전 항목을 즉시 반환하고,
+        시트 갱신은 백그라운드 스레드 하나에서만 수행합니다.
+        
+        Returns:
+            Tuple[float, List[Dict[str, str]]]: (만료 시각, 도움말 항목), 항목이 없으면 (0.0, [])
         """
         # 직접 캐시에서 조회 (fetch_func 없이)
-        cached_items = bot_cache.get("help_items")
-        if cached_items:
+        cached = bot_cache.get("help_items")
+        if cached:
+            if time.time() > cached[0]:
+                self._schedule_help_items_refresh()
             logger.debug("캐시에서 도움말 항목 로드")
-            return cached_items
+            return cached
         
         # 시트에서 로드
+        entry = self._refresh_help_items()
+        if entry is not None:
+            return entry
+        
+        # 빈 항목 반환
+        logger.info("도움말 항목 없음")
+        return 0.0, []
+    
+    def _refresh_help_items(self) -> Optional[Tuple[float, List[Dict[str, str]]]]:
+        """
+        시트에서 도움말 항목을 가져와 캐시에 저장
+        
+        Returns:
+            Optional[Tuple[float, List[Dict[str, str]]]]: 저장한 (만료 시각, 도움말 항목) (실패 시 None)
+        """
         try:
             if self.sheets_manager:
-                items = self.sheets_manager.get_help_items()
+                items = self._fetch_help_items()
                 if items:
-                    # 캐시에 저장 (1시간)
-                    bot_cache.set("help_items", items, 3600)
+                    # 1시간 후 갱신 대상, 만료 후에도 갱신 전까지 이전 값을 제공
+                    expires_at = time.time() + self.HELP_ITEMS_TTL
+                    bot_cache.set("help_items", (expires_at, items), self.HELP_ITEMS_STALE_TTL)
                     logger.debug(f"시트에서 도움말 항목 로드: {len(items)}개")
-                    return items
+                    return expires_at, items
         except Exception as e:
             logger.warning(f"시트에서 도움말 항목 로드 실패: {e}")
+        return None
+    
+    def _fetch_help_items(self) -> List[Dict[str, str]]:
+        """
+        시트에서 도움말 항목 조회
         
-        # 빈 리스트 반환
-        logger.info("도움말 항목 없음")
-        return []
+        시트 매니저가 배치 조회를 지원하면 운세 시트를 같은 요청으로 함께 읽어
+        운세 문구 캐시까지 채웁니다.
+        
+        Returns:
+            List[Dict[str, str]]: 도움말 항목
+        """
+        batch_read = getattr(self.sheets_manager, 'batch_read_worksheets', None)
+        if batch_read is None:
+            return self.sheets_manager.get_help_items()
+        
+        help_sheet = config.get_worksheet_name('HELP')
+        fortune_sheet = config.get_worksheet_name('FORTUNE')
+        data = batch_read([help_sheet, fortune_sheet])
+        
+        fortune_phrases = self.sheets_manager.extract_fortune_phrases(data.get(fortune_sheet, []))
+        if fortune_phrases:
+            bot_cache.set("fortune_phrases", fortune_phrases, config.FORTUNE_CACHE_TTL)
+        
+        return self.sheets_manager.extract_help_items(data.get(help_sheet, []))
+    
+    def _schedule_help_items_refresh(self) -> None:
+        """만료된 도움말 항목을 백그라운드에서 갱신 (동시에 하나만, 재시도 간격마다 한 번만 실행)"""
+        now = time.time()
+        if now < HelpCommand._next_refresh_at:
+            return
+        if not HelpCommand._refresh_lock.acquire(blocking=False):
+            return
+        
+        # 갱신이 실패해 만료 시각이 그대로 남아도 재시도 간격 동안은 새 스레드를 띄우지 않음
+        HelpCommand._next_refresh_at = now + self.HELP_ITEMS_RETRY_INTERVAL
+        
+        def refresh_worker():
+            try:
+                self._refresh_help_items()
+            finally:
+                HelpCommand._refresh_lock.release()
+        
+        threading.Thread(target=refresh_worker, daemon=True).start()
     
     def _count_commands_in_help(self, help_text: str) -> int:
         """
@@ -187,17 +278,11 @@ class HelpCommand(BaseCommand):
         if not help_text:
             return 0
         
-        # 줄바꿈으로 분할하여 명령어 라인 찾기
-        lines = help_text.split('\n')
-        command_count = 0
-        
-        for line in lines:
-            line = line.strip()
-            # '[' 로 시작하거나 ' - ' 를 포함하는 라인을 명령어로 간주
-            if line.startswith('[') or ' - ' in line:
-                command_count += 1
-        
-        return command_count
+        # '[' 로 시작하거나 ' - ' 를 포함하는 라인을 명령어로 간주
+        return sum(
+            1 for line in help_text.splitlines()
+            if line and (line[0] == '[' or ' - ' in line)
+        )
     
     def get_help_text(self) -> str:
         """도움말 텍스트 반환"""
@@ -225,27 +310,18 @@ class HelpCommand(BaseCommand):
             Dict: 도움말 시스템 통계
         """
         try:
-            # 도움말 항목 개수
+            # 도움말 항목 개수 (캐시 우선 로드이므로 시트 항목 수와 동일)
             help_items = self._load_help_items()
             total_items = len(help_items)
             
-            # 시트에서 로드된 항목 수
-            sheet_items = 0
-            if self.sheets_manager:
-                try:
-                    sheet_data = self.sheets_manager.get_help_items()
-                    sheet_items = len(sheet_data) if sheet_data else 0
-                except:
-                    pass
-            
             # 기본 도움말 사용 여부
-            using_default = sheet_items == 0
+            using_default = total_items == 0
             
             return {
                 'total_help_items': total_items,
-                'sheet_items_count': sheet_items,
+                'sheet_items_count': total_items,
                 'using_default_help': using_default,
-                'cache_available': bot_cache.get_help_items() is not None,
+                'cache_available': bot_cache.get("help_items") is not None,
                 'cache_ttl': config.FORTUNE_CACHE_TTL
             }
             
@@ -268,26 +344,30 @@ class HelpCommand(BaseCommand):
         }
         
         try:
-            # 시트에서 도움말 데이터 로드 시도
+            # 도움말 데이터 로드 시도 (캐시 우선, 시트 후순위)
             if self.sheets_manager:
                 try:
-                    help_items = self.sheets_manager.get_help_items()
+                    help_items = self._load_help_items()
                     if not help_items:
                         results['warnings'].append("시트에 도움말 데이터가 없습니다.")
                         results['info']['will_use_default'] = True
                     else:
                         results['info']['sheet_items_count'] = len(help_items)
                         
-                        # 빈 항목 확인
-                        empty_items = sum(1 for item in help_items 
-                                        if not item.get('명령어', '').strip() or 
-                                           not item.get('설명', '').strip())
+                        # 빈 항목 및 명령어 빈도를 한 번의 순회로 집계
+                        command_counter = Counter()
+                        empty_items = 0
+                        for item in help_items:
+                            command = item.get('명령어', '').strip()
+                            command_counter[command] += 1
+                            if not command or not item.get('설명', '').strip():
+                                empty_items += 1
+                        
                         if empty_items > 0:
                             results['warnings'].append(f"빈 도움말 항목이 {empty_items}개 있습니다.")
                         
                         # 중복 명령어 확인
-                        commands = [item.get('명령어', '').strip() for item in help_items]
-                        duplicates = [cmd for cmd in set(commands) if commands.count(cmd) > 1]
+                        duplicates = [cmd for cmd, count in command_counter.items() if count > 1 and cmd]
                         if duplicates:
                             results['warnings'].append(f"중복된 명령어: {', '.join(duplicates)}")
                 
@@ -299,10 +379,10 @@ class HelpCommand(BaseCommand):
                 results['info']['will_use_default'] = True
             
             # 캐시 상태 확인
-            cached_items = bot_cache.get_help_items()
-            results['info']['cache_available'] = cached_items is not None
-            if cached_items:
-                results['info']['cached_items_count'] = len(cached_items)
+            cached = bot_cache.get("help_items")
+            results['info']['cache_available'] = cached is not None
+            if cached:
+                results['info']['cached_items_count'] = len(cached[1])
             
             # 오류가 있으면 유효하지 않음
             if results['errors']:
@@ -343,6 +423,10 @@ class HelpCommand(BaseCommand):
             }
 
 
+# 도움말 명령어 키워드
+_HELP_KEYWORDS = frozenset(('도움말', 'help', '헬프'))
+
+
 # 도움말 관련 유틸리티 함수들
 def is_help_command(keyword: str) -> bool:
     """
@@ -357,8 +441,9 @@ def is_help_command(keyword: str) -> bool:
     if not keyword:
         return False
     
-    keyword = keyword.lower().strip()
-    return keyword in ['도움말', 'help', '헬프']
+    keyword = keyword.strip()
+    # 이미 정규형으로 입력된 경우(대부분의 '도움말') lower() 할당을 생략
+    return keyword in _HELP_KEYWORDS or keyword.lower() in _HELP_KEYWORDS
 
 
 def generate_simple_help(commands_info: List[Dict[str, str]]) -> str:
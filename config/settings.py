@@ -4,9 +4,11 @@
 """
 
 import os
+import re
 import sys
 from pathlib import Path
-from typing import Optional, List, Set, Dict
+from types import MappingProxyType
+from typing import Optional, List, FrozenSet, Dict, Mapping
 from functools import lru_cache
 
 # 경로 설정 (VM 환경 대응)
@@ -14,34 +16,40 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
 
 
-def _parse_env_line(line: str) -> tuple[str, str]:
-    """환경 변수 라인을 파싱하는 헬퍼 함수"""
-    if not line or line.startswith('#') or '=' not in line:
-        return None, None
-    
-    key, value = line.split('=', 1)
-    key = key.strip()
-    value = value.strip()
-    
-    # 따옴표 제거
-    if (value.startswith('"') and value.endswith('"')) or \
-       (value.startswith("'") and value.endswith("'")):
-        value = value[1:-1]
-    
-    return key, value
+# 연속 공백 정규화용 패턴
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+# .env 의 KEY=VALUE 라인 추출용 패턴
+# (주석 줄 제외, 키는 첫 '=' 앞부분 전체, 앞뒤 공백은 키와 값 모두에서 제거)
+_ENV_RE = re.compile(
+    r'^[ \t]*([^=\s#][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$',
+    re.M
+)
 
 
 def _load_env_file(env_path: Path, encoding: str) -> bool:
     """지정된 인코딩으로 .env 파일을 로드하는 함수"""
     try:
-        with open(env_path, 'r', encoding=encoding) as f:
-            for line in f:
-                key, value = _parse_env_line(line.strip())
-                if key and value:
-                    os.environ.setdefault(key, value)
-        return True
+        data = env_path.read_text(encoding=encoding)
     except UnicodeDecodeError:
         return False
+    
+    # 파일 전체를 한 번에 스캔 (같은 키가 여러 번 나오면 먼저 나온 값 유지)
+    env_vars = {}
+    for match in _ENV_RE.finditer(data):
+        key, value = match.groups()
+        
+        # 같은 따옴표로 감싼 값은 따옴표 제거
+        if value[:1] in ('"', "'") and value.endswith(value[0]):
+            value = value[1:-1]
+        
+        if value:
+            env_vars.setdefault(key, value)
+    
+    # 이미 설정된 환경 변수는 유지하고 한 번에 반영
+    os.environ.update({key: value for key, value in env_vars.items() if key not in os.environ})
+    return True
 
 
 def _load_env():
@@ -106,6 +114,9 @@ class Config:
         os.getenv('BOT_ACCOUNT_NAME', 'defaultbot').lower()
     ]
     
+    # 봇 계정 이름 매칭용 정규식 (한 번의 스캔으로 모든 이름 검사)
+    _BOT_NAME_RE = re.compile('|'.join(re.escape(name) for name in BOT_ACCOUNT_NAMES if name))
+    
     # 로그 설정
     LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
     LOG_FILE_PATH: str = os.getenv('LOG_FILE_PATH', 'bot.log')
@@ -139,16 +150,17 @@ class Config:
     _BASE_KEYWORDS = ['다이스', '카드뽑기', '운세', '도움말']
     _SPACE_KEYWORDS = ['카드 뽑기']  # 공백 포함 버전
     
-    SYSTEM_KEYWORDS: Set[str] = set(_BASE_KEYWORDS + _SPACE_KEYWORDS)
+    # 읽기 전용 (normalize_command의 lru_cache가 안전하도록 변경 불가로 고정)
+    SYSTEM_KEYWORDS: FrozenSet[str] = frozenset(_BASE_KEYWORDS + _SPACE_KEYWORDS)
     
-    # 명령어 정규화 매핑 (공백 제거 등)
-    COMMAND_NORMALIZATION = {
+    # 명령어 정규화 매핑 (공백 제거 등, 읽기 전용)
+    COMMAND_NORMALIZATION: Mapping[str, str] = MappingProxyType({
         '카드 뽑기': '카드뽑기',
         '카드  뽑기': '카드뽑기',  # 여러 공백
         '주사위': '다이스',
         '운세보기': '운세',
         '도움': '도움말'
-    }
+    })
     
     # 성공 메시지 상수
     SUCCESS_MESSAGES = {
@@ -192,9 +204,10 @@ class Config:
         return cred_path
     
     @classmethod
+    @lru_cache(maxsize=256)
     def normalize_command(cls, command: str) -> str:
         """
-        명령어를 정규화합니다 (공백 제거, 동의어 변환 등)
+        명령어를 정규화합니다 (공백 제거, 동의어 변환 등, 캐싱 적용)
         
         Args:
             command: 원본 명령어
@@ -205,17 +218,11 @@ class Config:
         if not command:
             return command
             
-        # 앞뒤 공백 제거
-        normalized = command.strip()
+        # 앞뒤 공백 제거 후 연속된 공백을 단일 공백으로
+        normalized = _WHITESPACE_RE.sub(' ', command.strip())
         
         # 정규화 매핑 적용
-        if normalized in cls.COMMAND_NORMALIZATION:
-            normalized = cls.COMMAND_NORMALIZATION[normalized]
-        
-        # 추가 정규화: 연속된 공백을 단일 공백으로
-        normalized = ' '.join(normalized.split())
-        
-        return normalized
+        return cls.COMMAND_NORMALIZATION.get(normalized, normalized)
     
     @classmethod
     def is_system_keyword(cls, keyword: str) -> bool:
@@ -231,8 +238,8 @@ class Config:
         if not keyword:
             return False
         
-        normalized = cls.normalize_command(keyword)
-        return normalized in cls.SYSTEM_KEYWORDS or keyword in cls.SYSTEM_KEYWORDS
+        # SYSTEM_KEYWORDS의 모든 항목은 정규화 후에도 SYSTEM_KEYWORDS에 속하므로 한 번의 검사로 충분
+        return cls.normalize_command(keyword) in cls.SYSTEM_KEYWORDS
     
     @classmethod
     def is_bot_account(cls, account_name: str) -> bool:
@@ -251,7 +258,7 @@ class Config:
         # @ 제거하고 소문자 변환
         clean_name = account_name.lstrip('@').lower()
         
-        return any(bot_name in clean_name for bot_name in cls.BOT_ACCOUNT_NAMES)
+        return cls._BOT_NAME_RE.search(clean_name) is not None
     
     @classmethod
     def get_worksheet_name(cls, key: str) -> Optional[str]:
@@ -307,10 +314,11 @@ class Config:
         if not message or not isinstance(message, str):
             return message
         
-        # 공백 제거
-        message = message.strip()
-        if not message:
-            return message
+        # 앞뒤에 공백이 있을 때만 제거 (대부분의 응답은 새 문자열 할당 없이 통과)
+        if message[:1].isspace() or message[-1:].isspace():
+            message = message.strip()
+            if not message:
+                return message
         
         # 이미 프리픽스가 있으면 중복 방지
         if message.startswith(cls.RESPONSE_PREFIX_STRIPPED):
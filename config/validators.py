@@ -4,32 +4,137 @@
 """
 
 import os
-import sys
 import re
+import operator
+import stat
+import copy
+import time
 import socket
-import ssl
 import urllib.parse
 from pathlib import Path
 from typing import List, Dict, Any, Tuple, Optional, Union
 from dataclasses import dataclass, field
 from functools import lru_cache
-import json
-import hashlib
+from concurrent.futures import ThreadPoolExecutor
 
-# 경로 설정 (VM 환경 대응)
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+_Config = None
 
-try:
-    from config.settings import Config
-except ImportError:
-    # VM 환경에서 임포트 실패 시 폴백
-    import importlib.util
-    settings_path = os.path.join(os.path.dirname(__file__), 'settings.py')
-    spec = importlib.util.spec_from_file_location("settings", settings_path)
-    settings_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(settings_module)
-    Config = settings_module.Config
+
+def _get_config():
+    """
+    Config 클래스를 처음 사용할 때 임포트합니다.
+    
+    검증기를 쓰지 않는 모듈이 config.validators 를 임포트해도
+    경로 설정과 폴백 임포트 비용을 치르지 않도록 지연시킵니다.
+    """
+    global _Config
+    if _Config is None:
+        try:
+            from config.settings import Config as _Config
+        except ImportError:
+            # VM 환경에서 임포트 실패 시 폴백
+            import importlib.util
+            settings_path = os.path.join(os.path.dirname(__file__), 'settings.py')
+            spec = importlib.util.spec_from_file_location("settings", settings_path)
+            settings_module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(settings_module)
+            _Config = settings_module.Config
+    return _Config
+
+
+# 네트워크 검사 결과 캐시 구간 (초)
+_NETWORK_PROBE_BUCKET_SECONDS = 30
+
+
+def _network_time_bucket() -> int:
+    """네트워크 검사 캐시 키로 쓰는 시간 구간 반환"""
+    return int(time.time() // _NETWORK_PROBE_BUCKET_SECONDS)
+
+
+# DNS 검사용 호스트 (IP 리터럴은 실제 질의가 일어나지 않으므로 호스트 이름 사용)
+_DNS_PROBE_HOST = "one.one.one.one"
+
+
+def _probe_dns() -> bool:
+    """실제 DNS 질의로 이름 해석 가능 여부 확인"""
+    try:
+        socket.getaddrinfo(_DNS_PROBE_HOST, 80, type=socket.SOCK_STREAM)
+        return True
+    except OSError:
+        return False
+
+
+def _probe_hostname(host: str) -> bool:
+    """호스트 이름 해석 가능 여부 확인"""
+    try:
+        socket.gethostbyname(host)
+        return True
+    except (OSError, UnicodeError):
+        # gaierror 외의 소켓 오류나 잘못된 호스트 이름도 실패로 처리 (스레드 밖으로 전파하지 않음)
+        return False
+
+
+def _probe_tcp(host: str, port: int, timeout: float) -> Optional[str]:
+    """TCP 연결 확인 (실패 시 오류 메시지 반환)"""
+    try:
+        # create_connection 은 IPv4/IPv6 를 모두 시도하고, with 블록으로 소켓을 확실히 닫는다
+        with socket.create_connection((host, port), timeout=timeout):
+            return None
+    except Exception as e:
+        return str(e)
+
+
+@lru_cache(maxsize=4)
+def _parsed_api_url(url: str) -> urllib.parse.ParseResult:
+    """API URL 파싱 결과 캐시 (같은 설정값을 검증마다 다시 파싱하지 않도록)"""
+    return urllib.parse.urlparse(url)
+
+
+@lru_cache(maxsize=1)
+def _probe_network(api_url: str, time_bucket: int) -> Tuple[Tuple[str, str], ...]:
+    """
+    DNS, Google Sheets, API 서버 연결을 병렬로 검사합니다.
+    
+    같은 시간 구간 안의 반복 호출은 캐시된 결과를 반환합니다.
+    
+    Returns:
+        Tuple[Tuple[str, str], ...]: 실패한 항목의 (종류, 상세) 목록
+            종류는 'dns', 'google', 'api' 중 하나
+    """
+    issues = []
+    
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        # DNS 연결 테스트
+        dns_future = executor.submit(_probe_dns)
+        # Google 서비스 연결 테스트
+        google_future = executor.submit(_probe_hostname, "sheets.googleapis.com")
+        
+        # API 서버 연결 테스트
+        api_future = None
+        api_error = None
+        if api_url:
+            try:
+                parsed_url = _parsed_api_url(api_url)
+                host = parsed_url.hostname or parsed_url.netloc
+                port = parsed_url.port or (443 if parsed_url.scheme == 'https' else 80)
+                api_target = f"{host}:{port}"
+                api_future = executor.submit(_probe_tcp, host, port, ConfigValidator.NETWORK_TIMEOUT)
+            except ValueError as e:
+                # 잘못된 포트 등 URL 자체 오류
+                api_target, api_error = api_url, str(e)
+        
+        if not dns_future.result():
+            issues.append(('dns', ''))
+        
+        if not google_future.result():
+            issues.append(('google', ''))
+        
+        if api_future is not None:
+            api_error = api_future.result()
+        if api_error:
+            issues.append(('api', f"{api_target} - {api_error}"))
+    
+    return tuple(issues)
 
 
 @dataclass
@@ -42,6 +147,9 @@ class ValidationResult:
     performance_issues: List[str] = field(default_factory=list)
     network_issues: List[str] = field(default_factory=list)
     
+    # 심각도 가중치: 에러, 보안, 성능, 네트워크, 경고 순 (타입 주석이 없으므로 필드 아님)
+    _SEVERITY_WEIGHTS = (20, 15, 10, 8, 5)
+    
     def add_error(self, error: str) -> None:
         """에러 추가"""
         self.errors.append(error)
@@ -54,17 +162,23 @@ class ValidationResult:
     def add_security_issue(self, issue: str) -> None:
         """보안 이슈 추가"""
         self.security_issues.append(issue)
-        self.warnings.append(f"보안: {issue}")
     
     def add_performance_issue(self, issue: str) -> None:
         """성능 이슈 추가"""
         self.performance_issues.append(issue)
-        self.warnings.append(f"성능: {issue}")
     
     def add_network_issue(self, issue: str) -> None:
         """네트워크 이슈 추가"""
         self.network_issues.append(issue)
-        self.warnings.append(f"네트워크: {issue}")
+    
+    def merge(self, other: 'ValidationResult') -> None:
+        """다른 검증 결과를 현재 결과에 병합 (제자리 확장)"""
+        self.errors.extend(other.errors)
+        self.warnings.extend(other.warnings)
+        self.security_issues.extend(other.security_issues)
+        self.performance_issues.extend(other.performance_issues)
+        self.network_issues.extend(other.network_issues)
+        self.is_valid = self.is_valid and other.is_valid
     
     def get_summary(self) -> str:
         """검증 결과 요약 반환 (보완된 버전)"""
@@ -79,37 +193,50 @@ class ValidationResult:
         else:
             summary.append("❌ 설정 검증 실패")
             
-        if self.errors:
-            summary.append("\n🚨 오류:")
-            summary.extend(f"  - {error}" for error in self.errors)
-        
-        if self.security_issues:
-            summary.append("\n🔒 보안 이슈:")
-            summary.extend(f"  - {issue}" for issue in self.security_issues)
-                
-        if self.performance_issues:
-            summary.append("\n⚡ 성능 이슈:")
-            summary.extend(f"  - {issue}" for issue in self.performance_issues)
-        
-        if self.network_issues:
-            summary.append("\n🌐 네트워크 이슈:")
-            summary.extend(f"  - {issue}" for issue in self.network_issues)
-                
-        if self.warnings:
-            summary.append("\n⚠️ 경고:")
-            summary.extend(f"  - {warning}" for warning in self.warnings)
+        for title, items in (
+            ("\n🚨 오류:", self.errors),
+            ("\n🔒 보안 이슈:", self.security_issues),
+            ("\n⚡ 성능 이슈:", self.performance_issues),
+            ("\n🌐 네트워크 이슈:", self.network_issues),
+            ("\n⚠️ 경고:", self.warnings),
+        ):
+            if items:
+                summary.append(title)
+                summary.extend([f"  - {item}" for item in items])
                 
         return "\n".join(summary)
     
     def get_severity_score(self) -> int:
         """검증 결과의 심각도 점수 반환 (0-100)"""
-        score = 0
-        score += len(self.errors) * 20  # 에러: 20점씩
-        score += len(self.security_issues) * 15  # 보안: 15점씩
-        score += len(self.performance_issues) * 10  # 성능: 10점씩
-        score += len(self.network_issues) * 8  # 네트워크: 8점씩
-        score += len(self.warnings) * 5  # 경고: 5점씩
-        return min(score, 100)
+        counts = (
+            len(self.errors),
+            len(self.security_issues),
+            len(self.performance_issues),
+            len(self.network_issues),
+            len(self.warnings),
+        )
+        return min(sum(map(operator.mul, self._SEVERITY_WEIGHTS, counts)), 100)
+
+
+# 워크시트 행 검증 함수 (WORKSHEET_VALIDATION_RULES 의 data_fields 순서대로 값을 받음)
+def _validate_roster_row(user_id: str, name: str) -> bool:
+    """명단 행 검증"""
+    return bool(user_id.strip() and name.strip())
+
+
+def _validate_custom_row(command: str, phrase: str) -> bool:
+    """커스텀 명령어 행 검증 (문구 최대 500자)"""
+    return bool(command.strip() and phrase.strip()) and len(phrase) <= 500
+
+
+def _validate_help_row(command: str, description: str) -> bool:
+    """도움말 행 검증 (설명 최대 200자)"""
+    return bool(command.strip() and description.strip()) and len(description) <= 200
+
+
+def _validate_fortune_row(phrase: str) -> bool:
+    """운세 행 검증 (운세 최대 300자)"""
+    return bool(phrase.strip()) and len(phrase) <= 300
 
 
 class ConfigValidator:
@@ -123,11 +250,13 @@ class ConfigValidator:
     MIN_TOKEN_LENGTH = 20
     MIN_CLIENT_ID_LENGTH = 10
     MIN_CLIENT_SECRET_LENGTH = 20
-    FORBIDDEN_PATTERNS = [
+    FORBIDDEN_PATTERNS = (
         r'password\s*=\s*["\']\w+["\']',
         r'secret\s*=\s*["\']\w+["\']',
         r'token\s*=\s*["\']\w+["\']',
-    ]
+    )
+    # 검증 때마다 다시 컴파일하지 않도록 클래스 로드 시 하나의 패턴으로 합쳐 컴파일
+    _FORBIDDEN_RE = re.compile('|'.join(f'(?:{p})' for p in FORBIDDEN_PATTERNS), re.IGNORECASE)
     
     # 성능 관련 상수
     MAX_CACHE_SIZE = 1000
@@ -138,8 +267,12 @@ class ConfigValidator:
     NETWORK_TIMEOUT = 10
     SSL_VERIFY_TIMEOUT = 5
     
+    # 환경 검증 결과 캐시 (DNS/소켓/파일 시스템 검사를 반복하지 않도록)
+    ENVIRONMENT_CACHE_TTL = 30  # 초
+    _environment_cache: Optional[Tuple[float, int, ValidationResult]] = None
+    
     # 검증 규칙 정의 (보완된 버전)
-    NUMERIC_CONFIGS = [
+    NUMERIC_CONFIGS = (
         ('MAX_RETRIES', 1, 10),
         ('BASE_WAIT_TIME', 1, 60),
         ('MAX_DICE_COUNT', 1, 100),
@@ -152,13 +285,19 @@ class ConfigValidator:
         ('API_TIMEOUT', 5, 60),
         ('CONNECTION_RETRY_INTERVAL', 1, 30),
         ('MAX_CONNECTION_RETRIES', 1, 10),
-    ]
-    
-    REQUIRED_ENV_VARS = [
-        'MASTODON_CLIENT_ID',
-        'MASTODON_CLIENT_SECRET', 
-        'MASTODON_ACCESS_TOKEN',
-    ]
+    )
+    _NUMERIC_NAMES = tuple(name for name, _, _ in NUMERIC_CONFIGS)
+    _NUMERIC_BOUNDS = tuple((min_val, max_val) for _, min_val, max_val in NUMERIC_CONFIGS)
+    
+    # (환경 변수 이름, 최소 길이, 너무 짧을 때의 보안 이슈 메시지)
+    REQUIRED_ENV_VARS = (
+        ('MASTODON_CLIENT_ID', MIN_CLIENT_ID_LENGTH,
+         f"클라이언트 ID가 너무 짧습니다. 최소 {MIN_CLIENT_ID_LENGTH}자 필요."),
+        ('MASTODON_CLIENT_SECRET', MIN_CLIENT_SECRET_LENGTH,
+         f"클라이언트 시크릿이 너무 짧습니다. 최소 {MIN_CLIENT_SECRET_LENGTH}자 필요."),
+        ('MASTODON_ACCESS_TOKEN', MIN_TOKEN_LENGTH,
+         f"액세스 토큰이 너무 짧습니다. 최소 {MIN_TOKEN_LENGTH}자 필요."),
+    )
     
     OPTIONAL_ENV_VARS = [
         'MASTODON_API_BASE_URL',
@@ -175,152 +314,141 @@ class ConfigValidator:
             'min_data_rows': 0,
             'validate_data': False,
             'max_data_rows': 10000,  # 최대 10,000명
-            'data_validation': lambda record: (
-                str(record.get('아이디', '')).strip() and 
-                str(record.get('이름', '')).strip()
-            )
+            'data_fields': ('아이디', '이름'),
+            'data_validation': _validate_roster_row,
         },
         'CUSTOM': {
             'required_headers': ['명령어', '문구'],
             'min_data_rows': 1,
             'validate_data': True,
             'max_data_rows': 1000,  # 최대 1,000개 커스텀 명령어
-            'data_validation': lambda record: (
-                str(record.get('명령어', '')).strip() and 
-                str(record.get('문구', '')).strip() and
-                len(str(record.get('문구', ''))) <= 500  # 문구 최대 500자
-            )
+            'data_fields': ('명령어', '문구'),
+            'data_validation': _validate_custom_row,
         },
         'HELP': {
             'required_headers': ['명령어', '설명'],
             'min_data_rows': 1,
             'validate_data': True,
             'max_data_rows': 100,  # 최대 100개 도움말
-            'data_validation': lambda record: (
-                str(record.get('명령어', '')).strip() and 
-                str(record.get('설명', '')).strip() and
-                len(str(record.get('설명', ''))) <= 200  # 설명 최대 200자
-            )
+            'data_fields': ('명령어', '설명'),
+            'data_validation': _validate_help_row,
         },
         'FORTUNE': {
             'required_headers': ['문구'],
             'min_data_rows': 1,
             'validate_data': True,
             'max_data_rows': 500,  # 최대 500개 운세
-            'data_validation': lambda record: (
-                str(record.get('문구', '')).strip() and
-                len(str(record.get('문구', ''))) <= 300  # 운세 최대 300자
-            )
+            'data_fields': ('문구',),
+            'data_validation': _validate_fortune_row,
         }
     }
     
     @staticmethod
-    def validate_environment() -> ValidationResult:
+    def validate_environment(use_cache: bool = True) -> ValidationResult:
         """
         환경 변수와 기본 설정을 엄격하게 검증합니다.
         
+        설정이 바뀌지 않았다면 ENVIRONMENT_CACHE_TTL 동안 이전 결과의 사본을 반환합니다.
+        
+        Args:
+            use_cache: 캐시된 결과 사용 여부
+            
         Returns:
             ValidationResult: 검증 결과
         """
+        config = _get_config()
+        fingerprint = ConfigValidator._get_config_fingerprint(config)
+        cached = ConfigValidator._environment_cache
+        if (use_cache and cached is not None and cached[1] == fingerprint and
+                time.monotonic() - cached[0] < ConfigValidator.ENVIRONMENT_CACHE_TTL):
+            return copy.deepcopy(cached[2])
+        
+        result = ConfigValidator._run_environment_checks(config)
+        ConfigValidator._environment_cache = (time.monotonic(), fingerprint, copy.deepcopy(result))
+        return result
+    
+    @staticmethod
+    def _get_config_fingerprint(config) -> int:
+        """설정 변경 감지를 위한 Config 지문 계산"""
+        return hash(repr(sorted(config.__dict__.items())))
+    
+    @staticmethod
+    def _run_environment_checks(config) -> ValidationResult:
+        """환경 검증 항목을 모두 실행"""
         result = ValidationResult()
         
         # 1. 필수 환경 변수 검증
-        ConfigValidator._validate_required_env_vars(result)
+        ConfigValidator._validate_required_env_vars(result, config)
         
         # 2. 보안 검증
-        ConfigValidator._validate_security_settings(result)
+        ConfigValidator._validate_security_settings(result, config)
         
         # 3. 네트워크 연결 검증
-        ConfigValidator._validate_network_connectivity(result)
+        ConfigValidator._validate_network_connectivity(result, config)
         
         # 4. 성능 검증
-        ConfigValidator._validate_performance_settings(result)
+        ConfigValidator._validate_performance_settings(result, config)
         
         # 5. 파일 시스템 검증
-        ConfigValidator._validate_file_system(result)
+        ConfigValidator._validate_file_system(result, config)
         
         # 6. 숫자 설정값 검증
-        ConfigValidator._validate_numeric_configs(result)
+        ConfigValidator._validate_numeric_configs(result, config)
         
         # 7. 로그 설정 검증
-        ConfigValidator._validate_logging_settings(result)
+        ConfigValidator._validate_logging_settings(result, config)
         
         # 8. API 설정 검증
-        ConfigValidator._validate_api_settings(result)
+        ConfigValidator._validate_api_settings(result, config)
         
         return result
     
     @staticmethod
-    def _validate_required_env_vars(result: ValidationResult) -> None:
+    def _validate_required_env_vars(result: ValidationResult, config) -> None:
         """필수 환경 변수 검증"""
-        for var_name in ConfigValidator.REQUIRED_ENV_VARS:
-            var_value = getattr(Config, var_name, '')
+        for var_name, min_length, short_message in ConfigValidator.REQUIRED_ENV_VARS:
+            var_value = getattr(config, var_name, '')
             if not var_value or var_value.strip() == '':
                 result.add_error(f"필수 환경 변수 '{var_name}'가 설정되지 않았습니다.")
-            else:
+            elif len(var_value) < min_length:
                 # 토큰 길이 검증
-                if var_name == 'MASTODON_ACCESS_TOKEN' and len(var_value) < ConfigValidator.MIN_TOKEN_LENGTH:
-                    result.add_security_issue(f"액세스 토큰이 너무 짧습니다. 최소 {ConfigValidator.MIN_TOKEN_LENGTH}자 필요.")
-                
-                if var_name == 'MASTODON_CLIENT_ID' and len(var_value) < ConfigValidator.MIN_CLIENT_ID_LENGTH:
-                    result.add_security_issue(f"클라이언트 ID가 너무 짧습니다. 최소 {ConfigValidator.MIN_CLIENT_ID_LENGTH}자 필요.")
-                
-                if var_name == 'MASTODON_CLIENT_SECRET' and len(var_value) < ConfigValidator.MIN_CLIENT_SECRET_LENGTH:
-                    result.add_security_issue(f"클라이언트 시크릿이 너무 짧습니다. 최소 {ConfigValidator.MIN_CLIENT_SECRET_LENGTH}자 필요.")
+                result.add_security_issue(short_message)
     
     @staticmethod
-    def _validate_security_settings(result: ValidationResult) -> None:
+    def _validate_security_settings(result: ValidationResult, config) -> None:
         """보안 설정 검증"""
         # HTTPS URL 검증
-        api_url = getattr(Config, 'MASTODON_API_BASE_URL', '')
+        api_url = getattr(config, 'MASTODON_API_BASE_URL', '')
         if api_url and not api_url.startswith('https://'):
             result.add_security_issue("API URL이 HTTPS가 아닙니다. 보안을 위해 HTTPS를 사용하세요.")
         
         # 민감한 정보 노출 검증
-        for pattern in ConfigValidator.FORBIDDEN_PATTERNS:
-            if re.search(pattern, str(Config.__dict__), re.IGNORECASE):
-                result.add_security_issue("설정에 민감한 정보가 노출되어 있습니다.")
-                break
+        # 설정 스냅샷을 한 번만 문자열로 만들고 한 번만 스캔
+        config_snapshot = str(config.__dict__)
+        if ConfigValidator._FORBIDDEN_RE.search(config_snapshot):
+            result.add_security_issue("설정에 민감한 정보가 노출되어 있습니다.")
         
         # 관리자 ID 검증
-        admin_id = getattr(Config, 'SYSTEM_ADMIN_ID', '')
+        admin_id = getattr(config, 'SYSTEM_ADMIN_ID', '')
         if not admin_id or admin_id.strip() == '':
             result.add_warning("SYSTEM_ADMIN_ID가 설정되지 않았습니다. 오류 알림을 받을 수 없습니다.")
         elif len(admin_id) < 3:
             result.add_security_issue("관리자 ID가 너무 짧습니다.")
     
     @staticmethod
-    def _validate_network_connectivity(result: ValidationResult) -> None:
+    def _validate_network_connectivity(result: ValidationResult, config) -> None:
         """네트워크 연결 검증"""
-        try:
-            # DNS 연결 테스트
-            socket.gethostbyname("8.8.8.8")
-        except socket.gaierror:
-            result.add_network_issue("DNS 연결에 문제가 있습니다.")
-        
-        # API 서버 연결 테스트
-        api_url = getattr(Config, 'MASTODON_API_BASE_URL', '')
-        if api_url:
-            try:
-                parsed_url = urllib.parse.urlparse(api_url)
-                host = parsed_url.netloc
-                port = parsed_url.port or (443 if parsed_url.scheme == 'https' else 80)
-                
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(ConfigValidator.NETWORK_TIMEOUT)
-                sock.connect((host, port))
-                sock.close()
-            except Exception as e:
-                result.add_network_issue(f"API 서버 연결 실패: {host}:{port} - {str(e)}")
-        
-        # Google 서비스 연결 테스트
-        try:
-            socket.gethostbyname("sheets.googleapis.com")
-        except socket.gaierror:
-            result.add_network_issue("Google Sheets API 연결에 문제가 있습니다.")
+        api_url = getattr(config, 'MASTODON_API_BASE_URL', '')
+        for kind, detail in _probe_network(api_url, _network_time_bucket()):
+            if kind == 'dns':
+                result.add_network_issue("DNS 연결에 문제가 있습니다.")
+            elif kind == 'google':
+                result.add_network_issue("Google Sheets API 연결에 문제가 있습니다.")
+            else:
+                result.add_network_issue(f"API 서버 연결 실패: {detail}")
     
     @staticmethod
-    def _validate_performance_settings(result: ValidationResult) -> None:
+    def _validate_performance_settings(result: ValidationResult, config) -> None:
         """성능 설정 검증"""
         # 메모리 사용량 검증
         try:
@@ -332,75 +460,86 @@ class ConfigValidator:
             result.add_warning("psutil이 설치되지 않아 메모리 검증을 건너뜁니다.")
         
         # 캐시 설정 검증
-        cache_ttl = getattr(Config, 'FORTUNE_CACHE_TTL', 3600)
+        cache_ttl = getattr(config, 'FORTUNE_CACHE_TTL', 3600)
         if cache_ttl > 86400:  # 24시간
             result.add_performance_issue("캐시 TTL이 너무 깁니다. 메모리 사용량이 증가할 수 있습니다.")
         
         # 로그 파일 크기 검증
-        log_max_bytes = getattr(Config, 'LOG_MAX_BYTES', 10485760)
+        log_max_bytes = getattr(config, 'LOG_MAX_BYTES', 10485760)
         if log_max_bytes > ConfigValidator.MAX_LOG_FILE_SIZE:
             result.add_performance_issue("로그 파일 크기가 너무 큽니다. 디스크 공간을 많이 사용할 수 있습니다.")
     
     @staticmethod
-    def _validate_file_system(result: ValidationResult) -> None:
+    def _validate_file_system(result: ValidationResult, config) -> None:
         """파일 시스템 검증"""
         # Google 인증 파일 검증
-        cred_path = Config.get_credentials_path()
-        if not cred_path.exists():
+        cred_path = config.get_credentials_path()
+        try:
+            # stat 한 번으로 존재 여부, 파일 종류, 크기, 권한을 모두 확인
+            cred_stat = os.stat(cred_path)
+        except FileNotFoundError:
             result.add_error(f"Google 인증 파일을 찾을 수 없습니다: {cred_path}")
-        elif not cred_path.is_file():
-            result.add_error(f"Google 인증 파일이 올바른 파일이 아닙니다: {cred_path}")
+        except OSError as e:
+            # 권한 부족, 심볼릭 링크 순환 등은 파일 없음과 구분해서 보고
+            result.add_error(f"Google 인증 파일을 확인할 수 없습니다: {cred_path} ({e.strerror or e})")
         else:
-            # 파일 크기 검증
-            if cred_path.stat().st_size > 1024 * 1024:  # 1MB
-                result.add_security_issue("Google 인증 파일이 너무 큽니다. 보안상 문제가 있을 수 있습니다.")
-            
-            # 파일 권한 검증
-            try:
-                if os.access(cred_path, os.R_OK):
+            if not stat.S_ISREG(cred_stat.st_mode):
+                result.add_error(f"Google 인증 파일이 올바른 파일이 아닙니다: {cred_path}")
+            else:
+                # 파일 크기 검증
+                if cred_stat.st_size > 1024 * 1024:  # 1MB
+                    result.add_security_issue("Google 인증 파일이 너무 큽니다. 보안상 문제가 있을 수 있습니다.")
+                
+                # 파일 권한 검증 (그룹/기타 사용자 읽기 비트, POSIX 에서만 의미 있음)
+                if os.name != 'nt' and cred_stat.st_mode & 0o044:
                     result.add_security_issue("Google 인증 파일이 다른 사용자에게 읽기 권한이 있습니다.")
-            except OSError:
-                pass
         
         # 로그 디렉토리 검증
-        ConfigValidator._validate_log_directory(result)
+        ConfigValidator._validate_log_directory(result, config)
     
     @staticmethod
-    def _validate_numeric_configs(result: ValidationResult) -> None:
+    def _validate_numeric_configs(result: ValidationResult, config) -> None:
         """숫자 설정값 검증"""
-        for name, min_val, max_val in ConfigValidator.NUMERIC_CONFIGS:
-            value = getattr(Config, name, None)
-            if not isinstance(value, int) or value < min_val or value > max_val:
-                result.add_error(f"{name}은 {min_val}과 {max_val} 사이의 정수여야 합니다. 현재값: {value}")
+        names = ConfigValidator._NUMERIC_NAMES
+        values = [getattr(config, name, None) for name in names]
+        
+        # 범위를 벗어난 항목만 골라 오류 메시지 생성
+        failures = (
+            (name, value, bounds)
+            for name, value, bounds in zip(names, values, ConfigValidator._NUMERIC_BOUNDS)
+            if not isinstance(value, int) or not bounds[0] <= value <= bounds[1]
+        )
+        for name, value, (min_val, max_val) in failures:
+            result.add_error(f"{name}은 {min_val}과 {max_val} 사이의 정수여야 합니다. 현재값: {value}")
     
     @staticmethod
-    def _validate_logging_settings(result: ValidationResult) -> None:
+    def _validate_logging_settings(result: ValidationResult, config) -> None:
         """로깅 설정 검증"""
         # 로그 레벨 검증
-        log_level = getattr(Config, 'LOG_LEVEL', 'INFO')
+        log_level = getattr(config, 'LOG_LEVEL', 'INFO')
         if log_level.upper() not in ConfigValidator.VALID_LOG_LEVELS:
             result.add_error(f"LOG_LEVEL은 다음 중 하나여야 합니다: {', '.join(ConfigValidator.VALID_LOG_LEVELS)}")
         
         # 디버그 모드 검증
-        debug_mode = getattr(Config, 'DEBUG_MODE', False)
+        debug_mode = getattr(config, 'DEBUG_MODE', False)
         if debug_mode and log_level.upper() != 'DEBUG':
             result.add_warning("디버그 모드가 활성화되었지만 로그 레벨이 DEBUG가 아닙니다.")
         
         # 시트 이름 검증
-        sheet_name = getattr(Config, 'SHEET_NAME', '')
+        sheet_name = getattr(config, 'SHEET_NAME', '')
         if not sheet_name or sheet_name.strip() == '':
             result.add_error("SHEET_NAME이 설정되지 않았습니다.")
         elif len(sheet_name) > 100:
             result.add_warning("시트 이름이 너무 깁니다.")
     
     @staticmethod
-    def _validate_api_settings(result: ValidationResult) -> None:
+    def _validate_api_settings(result: ValidationResult, config) -> None:
         """API 설정 검증"""
         # API URL 형식 검증
-        api_url = getattr(Config, 'MASTODON_API_BASE_URL', '')
+        api_url = getattr(config, 'MASTODON_API_BASE_URL', '')
         if api_url:
             try:
-                parsed = urllib.parse.urlparse(api_url)
+                parsed = _parsed_api_url(api_url)
                 if not parsed.scheme or not parsed.netloc:
                     result.add_error("API URL 형식이 올바르지 않습니다.")
                 elif parsed.scheme not in ['http', 'https']:
@@ -409,9 +548,9 @@ class ConfigValidator:
                 result.add_error(f"API URL 파싱 실패: {str(e)}")
     
     @staticmethod
-    def _validate_log_directory(result: ValidationResult) -> None:
+    def _validate_log_directory(result: ValidationResult, config) -> None:
         """로그 디렉토리 검증 및 생성 (보완된 버전)"""
-        log_dir = Path(Config.LOG_FILE_PATH).parent
+        log_dir = Path(config.LOG_FILE_PATH).parent
         if not log_dir.exists():
             try:
                 log_dir.mkdir(parents=True, exist_ok=True)
@@ -442,15 +581,26 @@ class ConfigValidator:
         result = ValidationResult()
         
         try:
+            # 설정과 워크시트 목록은 한 번만 조회해서 모든 검증에 재사용
+            config = _get_config()
+            worksheets = {ws.title: ws for ws in sheet.worksheets()}
+            
+            # 검증 대상 워크시트 값은 한 번의 배치 요청으로 가져온다
+            target_names = [
+                name for name in map(config.get_worksheet_name, ConfigValidator.WORKSHEET_VALIDATION_RULES)
+                if name in worksheets
+            ]
+            sheet_values = ConfigValidator._batch_get_values(sheet, worksheets, target_names)
+            
             # 1. 필수 워크시트 존재 확인
-            ConfigValidator._validate_required_worksheets(sheet, result)
+            ConfigValidator._validate_required_worksheets(worksheets, result, config)
             
             # 2. 각 워크시트별 구조 검증
             for sheet_key, rules in ConfigValidator.WORKSHEET_VALIDATION_RULES.items():
-                ConfigValidator._validate_worksheet(sheet, sheet_key, rules, result)
+                ConfigValidator._validate_worksheet(worksheets, sheet_values, sheet_key, rules, result, config)
             
             # 3. 데이터 무결성 검증
-            ConfigValidator._validate_data_integrity(sheet, result)
+            ConfigValidator._validate_data_integrity(worksheets, result)
             
         except Exception as e:
             result.add_error(f"시트 구조 검증 중 오류 발생: {str(e)}")
@@ -458,10 +608,29 @@ class ConfigValidator:
         return result
     
     @staticmethod
-    def _validate_required_worksheets(sheet, result: ValidationResult) -> None:
+    def _batch_get_values(sheet, worksheets: Dict[str, Any], names: List[str]) -> Dict[str, List[List[str]]]:
+        """여러 워크시트의 값을 values.batchGet 한 번으로 조회 (실패 시 워크시트별 조회로 폴백)"""
+        if not names:
+            return {}
+        
+        # gspread 는 시트 검증 시에만 필요하므로 모듈 임포트 비용에 포함하지 않음
+        from gspread.exceptions import APIError
+        from gspread.utils import absolute_range_name
+        
+        try:
+            response = sheet.values_batch_get([absolute_range_name(name) for name in names])
+            value_ranges = response.get('valueRanges', [])
+            return {name: value_range.get('values', []) for name, value_range in zip(names, value_ranges)}
+        except APIError as e:
+            from utils.logging_config import logger
+            logger.warning(f"워크시트 배치 조회 실패, 워크시트별 조회로 전환합니다: {e}")
+            return {name: worksheets[name].get_all_values() for name in names}
+    
+    @staticmethod
+    def _validate_required_worksheets(worksheets: Dict[str, Any], result: ValidationResult, config) -> None:
         """필수 워크시트 존재 확인"""
-        worksheet_titles = frozenset(ws.title for ws in sheet.worksheets())
-        required_worksheets = frozenset(Config.WORKSHEET_NAMES.values())
+        worksheet_titles = frozenset(worksheets)
+        required_worksheets = frozenset(config.WORKSHEET_NAMES.values())
         
         missing_worksheets = required_worksheets - worksheet_titles
         for missing_sheet in missing_worksheets:
@@ -473,23 +642,29 @@ class ConfigValidator:
             result.add_warning(f"추가 워크시트가 발견되었습니다: {', '.join(extra_worksheets)}")
     
     @staticmethod
-    def _validate_worksheet(sheet, sheet_key: str, rules: Dict, result: ValidationResult) -> None:
+    def _validate_worksheet(worksheets: Dict[str, Any], sheet_values: Dict[str, List[List[str]]],
+                            sheet_key: str, rules: Dict, result: ValidationResult, config) -> None:
         """워크시트 검증 (보완된 버전)"""
         try:
-            worksheet_name = Config.get_worksheet_name(sheet_key)
+            worksheet_name = config.get_worksheet_name(sheet_key)
             if not worksheet_name:
                 result.add_error(f"워크시트 이름을 찾을 수 없습니다: {sheet_key}")
                 return
                 
-            worksheet = sheet.worksheet(worksheet_name)
-            headers = worksheet.row_values(1) if worksheet.row_count > 0 else []
+            worksheet = worksheets.get(worksheet_name)
+            if worksheet is None:
+                result.add_error(f"'{worksheet_name}' 시트 검증 실패: 워크시트를 찾을 수 없습니다.")
+                return
+            
+            rows = sheet_values.get(worksheet_name, [])
+            headers = rows[0] if rows else []
             
             # 1. 헤더 검증
             ConfigValidator._validate_worksheet_headers(worksheet_name, headers, rules, result)
             
             # 2. 데이터 검증
             if rules.get('validate_data', False):
-                ConfigValidator._validate_worksheet_data(worksheet, worksheet_name, rules, result)
+                ConfigValidator._validate_worksheet_data(worksheet, worksheet_name, rows, rules, result, config)
             
             # 3. 데이터 양 검증
             ConfigValidator._validate_data_volume(worksheet, worksheet_name, rules, result)
@@ -501,18 +676,23 @@ class ConfigValidator:
     def _validate_worksheet_headers(worksheet_name: str, headers: List[str], rules: Dict, result: ValidationResult) -> None:
         """워크시트 헤더 검증"""
         required_headers = rules.get('required_headers', [])
-        missing_headers = [h for h in required_headers if h not in headers]
+        headers_set = frozenset(headers)
+        required_set = frozenset(required_headers)
         
-        for header in missing_headers:
-            result.add_error(f"'{worksheet_name}' 시트에 '{header}' 헤더가 없습니다.")
+        # 모두 있으면 누락 검사 생략 (메시지 순서는 원래 목록 순서 유지)
+        if not required_set <= headers_set:
+            for header in required_headers:
+                if header not in headers_set:
+                    result.add_error(f"'{worksheet_name}' 시트에 '{header}' 헤더가 없습니다.")
         
         # 추가 헤더 확인
-        extra_headers = [h for h in headers if h not in required_headers]
+        extra_headers = [h for h in headers if h not in required_set] if headers_set - required_set else []
         if extra_headers:
             result.add_warning(f"'{worksheet_name}' 시트에 추가 헤더가 있습니다: {', '.join(extra_headers)}")
     
     @staticmethod
-    def _validate_worksheet_data(worksheet, worksheet_name: str, rules: Dict, result: ValidationResult) -> None:
+    def _validate_worksheet_data(worksheet, worksheet_name: str, rows: List[List[str]],
+                                 rules: Dict, result: ValidationResult, config) -> None:
         """워크시트 데이터 검증 (보완된 버전)"""
         min_data_rows = rules.get('min_data_rows', 0)
         data_validation = rules.get('data_validation')
@@ -523,28 +703,48 @@ class ConfigValidator:
             return
         
         if data_validation:
-            all_records = worksheet.get_all_records()
-            valid_records = []
-            invalid_records = []
+            # 유효한 레코드 자체는 커스텀 시트 검증에서만 필요하므로 그 외에는 개수만 센다
+            is_custom_sheet = worksheet_name == config.get_worksheet_name('CUSTOM')
+            valid_records = [] if is_custom_sheet else None
+            valid_count = 0
+            invalid_indices = []
+            
+            # 검증할 필드가 헤더에 없으면 빈 값으로 취급되도록 헤더 뒤에 붙인다
+            data_fields = rules.get('data_fields', ())
+            headers = rows[0] if rows else []
+            headers = headers + [f for f in data_fields if f not in headers]
+            header_count = len(headers)
             
-            for i, record in enumerate(all_records, start=2):  # 2부터 시작 (헤더 제외)
-                if data_validation(record):
-                    valid_records.append(record)
+            # 이미 받아온 값으로 레코드를 직접 구성 (짧은 행은 빈 문자열로 채움)
+            records = (
+                dict(zip(headers, row + [''] * (header_count - len(row))))
+                for row in rows[1:]
+            )
+            
+            get_fields = operator.itemgetter(*data_fields)
+            unpack = len(data_fields) > 1
+            
+            for i, record in enumerate(records, start=2):  # 2부터 시작 (헤더 제외)
+                values = get_fields(record)
+                if data_validation(*values) if unpack else data_validation(values):
+                    valid_count += 1
+                    if valid_records is not None:
+                        valid_records.append(record)
                 else:
-                    invalid_records.append(i)
+                    invalid_indices.append(i)
             
-            if len(valid_records) == 0:
+            if valid_count == 0:
                 if min_data_rows > 0:
                     result.add_error(f"'{worksheet_name}' 시트에 유효한 데이터가 없습니다.")
                 else:
                     result.add_warning(f"'{worksheet_name}' 시트에 유효한 데이터가 없습니다.")
             
-            if invalid_records:
-                result.add_warning(f"'{worksheet_name}' 시트에 {len(invalid_records)}개의 유효하지 않은 행이 있습니다: {invalid_records[:5]}{'...' if len(invalid_records) > 5 else ''}")
+            if invalid_indices:
+                result.add_warning(f"'{worksheet_name}' 시트에 {len(invalid_indices)}개의 유효하지 않은 행이 있습니다: {invalid_indices[:5]}{'...' if len(invalid_indices) > 5 else ''}")
             
             # 커스텀 시트 특별 검증
-            if worksheet_name == Config.get_worksheet_name('CUSTOM'):
-                ConfigValidator._validate_custom_commands(valid_records, result)
+            if is_custom_sheet:
+                ConfigValidator._validate_custom_commands(valid_records, result, config)
     
     @staticmethod
     def _validate_data_volume(worksheet, worksheet_name: str, rules: Dict, result: ValidationResult) -> None:
@@ -556,21 +756,22 @@ class ConfigValidator:
             result.add_performance_issue(f"'{worksheet_name}' 시트의 데이터가 너무 많습니다. 최대 {max_data_rows}행 권장, 현재 {data_rows}행")
     
     @staticmethod
-    def _validate_custom_commands(all_records: List[Dict], result: ValidationResult) -> None:
+    def _validate_custom_commands(all_records: List[Dict], result: ValidationResult, config) -> None:
         """커스텀 명령어 중복 검증 (보완된 버전)"""
-        commands = []
+        is_system_keyword = config.is_system_keyword
+        seen = set()
         duplicates = []
         
         for record in all_records:
             command = str(record.get('명령어', '')).strip()
             if command:
-                if command in commands:
+                if command in seen:
                     duplicates.append(command)
                 else:
-                    commands.append(command)
+                    seen.add(command)
                 
                 # 시스템 키워드 중복 검사
-                if Config.is_system_keyword(command):
+                if is_system_keyword(command):
                     result.add_warning(f"커스텀 명령어 '{command}'가 시스템 키워드와 중복됩니다.")
                 
                 # 명령어 형식 검사
@@ -580,22 +781,22 @@ class ConfigValidator:
                     result.add_warning(f"커스텀 명령어 '{command}'가 너무 깁니다.")
         
         if duplicates:
-            result.add_error(f"중복된 커스텀 명령어가 있습니다: {', '.join(set(duplicates))}")
+            result.add_error(f"중복된 커스텀 명령어가 있습니다: {', '.join(sorted(set(duplicates)))}")
     
     @staticmethod
-    def _validate_data_integrity(sheet, result: ValidationResult) -> None:
+    def _validate_data_integrity(worksheets: Dict[str, Any], result: ValidationResult) -> None:
         """데이터 무결성 검증"""
         try:
+            # 워크시트별 행/열 수는 한 번씩만 읽는다
+            dimensions = [(title, ws.row_count, ws.col_count) for title, ws in worksheets.items()]
+            
             # 전체 시트 크기 검증
-            total_cells = sum(ws.row_count * ws.col_count for ws in sheet.worksheets())
+            total_cells = sum(rows * cols for _, rows, cols in dimensions)
             if total_cells > 1000000:  # 100만 셀
                 result.add_performance_issue("전체 시트 크기가 너무 큽니다. 성능에 영향을 줄 수 있습니다.")
             
-            # 빈 시트 확인
-            empty_worksheets = []
-            for ws in sheet.worksheets():
-                if ws.row_count <= 1:  # 헤더만 있거나 빈 시트
-                    empty_worksheets.append(ws.title)
+            # 빈 시트 확인 (헤더만 있거나 빈 시트)
+            empty_worksheets = [title for title, rows, _ in dimensions if rows <= 1]
             
             if empty_worksheets:
                 result.add_warning(f"빈 워크시트가 있습니다: {', '.join(empty_worksheets)}")
@@ -619,22 +820,12 @@ class ConfigValidator:
         
         # 시트가 제공된 경우 시트 구조도 검증
         if sheet is not None:
-            sheet_result = ConfigValidator.validate_sheet_structure(sheet)
-            
             # 결과 합성
-            combined_result = ValidationResult(
-                is_valid=env_result.is_valid and sheet_result.is_valid,
-                errors=env_result.errors + sheet_result.errors,
-                warnings=env_result.warnings + sheet_result.warnings,
-                security_issues=env_result.security_issues + sheet_result.security_issues,
-                performance_issues=env_result.performance_issues + sheet_result.performance_issues,
-                network_issues=env_result.network_issues + sheet_result.network_issues
-            )
+            env_result.merge(ConfigValidator.validate_sheet_structure(sheet))
         else:
-            combined_result = env_result
-            combined_result.add_warning("시트 구조 검증을 수행하지 않았습니다.")
+            env_result.add_warning("시트 구조 검증을 수행하지 않았습니다.")
         
-        return combined_result
+        return env_result
     
     @staticmethod
     def get_validation_report() -> Dict[str, Any]:
@@ -691,32 +882,14 @@ def validate_network_connectivity() -> Tuple[bool, List[str]]:
         Tuple[bool, List[str]]: (연결 성공 여부, 문제 목록)
     """
     issues = []
+    api_url = getattr(_get_config(), 'MASTODON_API_BASE_URL', '')
     
-    # DNS 연결 테스트
-    try:
-        socket.gethostbyname("8.8.8.8")
-    except socket.gaierror:
-        issues.append("DNS 연결 실패")
-    
-    # Google 서비스 연결 테스트
-    try:
-        socket.gethostbyname("sheets.googleapis.com")
-    except socket.gaierror:
-        issues.append("Google Sheets API 연결 실패")
-    
-    # API 서버 연결 테스트
-    api_url = getattr(Config, 'MASTODON_API_BASE_URL', '')
-    if api_url:
-        try:
-            parsed_url = urllib.parse.urlparse(api_url)
-            host = parsed_url.netloc
-            port = parsed_url.port or (443 if parsed_url.scheme == 'https' else 80)
-            
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(ConfigValidator.NETWORK_TIMEOUT)
-            sock.connect((host, port))
-            sock.close()
-        except Exception as e:
-            issues.append(f"API 서버 연결 실패: {str(e)}")
+    for kind, detail in _probe_network(api_url, _network_time_bucket()):
+        if kind == 'dns':
+            issues.append("DNS 연결 실패")
+        elif kind == 'google':
+            issues.append("Google Sheets API 연결 실패")
+        else:
+            issues.append(f"API 서버 연결 실패: {detail}")
     
-    return len(issues) == 0, issues
\ No newline at end of file
+    return len(issues) == 0, issues
@@ -0,0 +1,293 @@
+"""
+명령어 라우터 테스트
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+
+from handlers import command_router
+from handlers.command_router import (
+    CommandRouter, parse_command_from_text, validate_command_format
+)
+
+
+class StubCommand:
+    """실행 횟수와 받은 사용자/키워드를 기록하는 테스트용 명령어"""
+
+    def __init__(self, requires_user: bool = True):
+        self.requires_user = requires_user
+        self.calls = []
+        self.keywords = []
+
+    def execute(self, user, keywords):
+        self.calls.append(user)
+        self.keywords.append(keywords)
+        return f"result-{len(self.calls)}"
+
+
+class FakeClock:
+    """time.monotonic 대체용 시계"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class RouterTestCase(unittest.TestCase):
+    """라우터 테스트 공통 설정 (명령어 모듈 임포트와 플러그인 경로 없이 실행)"""
+
+    def setUp(self):
+        self.sheets_manager = Mock()
+        self.sheets_manager.find_user_by_id_real_time.side_effect = (
+            lambda user_id: {'아이디': user_id, '이름': '테스터'}
+        )
+        self.sheets_manager.get_custom_commands_cached.return_value = {'인사': ['안녕']}
+
+        self.router = CommandRouter(self.sheets_manager, eager_load=False)
+        self.commands = {
+            command_type: StubCommand(requires_user)
+            for command_type, requires_user in (
+                ('help', False), ('shop', True), ('money', True),
+                ('buy', True), ('dice', False), ('custom', True),
+            )
+        }
+        self.router._command_instances.update(self.commands)
+
+        self.clock = FakeClock()
+        for patcher in (
+            patch.object(command_router.time, 'monotonic', self.clock),
+            patch.object(command_router, '_PLUGINS_ENABLED', False),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+
+class TestMatchCache(RouterTestCase):
+    """다이스 매칭 캐시 테스트"""
+
+    def test_match_cache_evicts_oldest(self):
+        """다이스 매칭 결과는 최대 크기까지만 보관"""
+        self.router.MATCH_CACHE_SIZE = 2
+        for expression in ('1d6', '2d6', '3d6'):
+            self.router.route_command('user1', [expression])
+
+        self.assertEqual(list(self.router._match_cache), ['2d6', '3d6'])
+        self.assertEqual(len(self.commands['dice'].calls), 3)
+
+
+class TestCustomCommandCache(RouterTestCase):
+    """커스텀 명령어 목록 캐시 테스트"""
+
+    def test_custom_commands_cached_within_ttl(self):
+        """커스텀 명령어 목록은 TTL 동안 다시 조회하지 않음"""
+        self.router.route_command('user1', ['인사'])
+        self.router.route_command('user1', ['인사'])
+        self.assertEqual(self.sheets_manager.get_custom_commands_cached.call_count, 1)
+        self.assertEqual(len(self.commands['custom'].calls), 2)
+
+        self.clock.advance(CommandRouter.CUSTOM_COMMANDS_TTL)
+        self.router.route_command('user1', ['인사'])
+        self.assertEqual(self.sheets_manager.get_custom_commands_cached.call_count, 2)
+
+    def test_custom_command_set_rebuilt_only_on_new_source(self):
+        """시트 캐시가 같은 객체를 돌려주면 집합을 다시 만들지 않음"""
+        first = self.router._get_custom_command_set()
+        self.clock.advance(CommandRouter.CUSTOM_COMMANDS_TTL)
+        self.assertIs(self.router._get_custom_command_set(), first)
+
+        self.sheets_manager.get_custom_commands_cached.return_value = {'춤': ['춤춤']}
+        self.clock.advance(CommandRouter.CUSTOM_COMMANDS_TTL)
+        self.assertEqual(self.router._get_custom_command_set(), frozenset({'춤'}))
+
+
+class TestCommandFormat(unittest.TestCase):
+    """명령어 형식 검증 테스트"""
+
+    def test_validation_matches_parsing(self):
+        """검증 결과는 파싱 결과와 일치"""
+        for text in ("[다이스/2d6]", "[]x[a]", "]x[a]", "[]", "[/]", "][", "[a", "abc"):
+            with self.subTest(text=text):
+                is_valid, _ = validate_command_format(text)
+                self.assertEqual(is_valid, bool(parse_command_from_text(text)))
+
+    def test_empty_brackets_message(self):
+        """빈 괄호만 있으면 비어있음으로 보고"""
+        self.assertEqual(validate_command_format("[]"), (False, "명령어가 비어있습니다."))
+
+
+class TestKeywordNormalization(RouterTestCase):
+    """키워드 정규화 테스트 (별칭/소문자 변환은 첫 키워드에만 적용)"""
+
+    def test_alias_applied_to_first_keyword_only(self):
+        """빠른 정규화 별칭은 첫 키워드만 바꿈"""
+        self.assertEqual(
+            self.router._normalize_keywords_safe(['주사위', '주사위']),
+            ['다이스', '주사위']
+        )
+
+    def test_first_keyword_lowercased_only(self):
+        """소문자 변환은 첫 키워드만 (나머지는 대소문자가 의미 있는 인자)"""
+        self.assertEqual(
+            self.router._normalize_keywords_safe([' HELP ', 'Potion', '']),
+            ['help', 'Potion']
+        )
+
+    def test_command_receives_normalized_keywords(self):
+        """명령어는 정규화된 키워드를 그대로 받음"""
+        self.router.route_command('user1', ['도움', '도움'])
+        self.assertEqual(self.commands['help'].keywords, [['도움말', '도움']])
+
+
+class TestResultCache(RouterTestCase):
+    """조회 전용 명령어 결과 캐시 테스트"""
+
+    def test_readonly_result_reused_within_ttl(self):
+        """TTL 안에서는 같은 결과 재사용"""
+        first = self.router.route_command('user1', ['도움말'])
+        second = self.router.route_command('user1', ['도움말'])
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.commands['help'].calls), 1)
+
+    def test_readonly_result_expires(self):
+        """TTL이 지나면 다시 실행"""
+        self.router.route_command('user1', ['도움말'])
+        self.clock.advance(CommandRouter.READONLY_RESULT_TTL + 0.1)
+
+        self.assertEqual(self.router.route_command('user1', ['도움말']), 'result-2')
+        self.assertEqual(len(self.commands['help'].calls), 2)
+
+    def test_result_cache_evicts_oldest(self):
+        """최대 크기를 넘으면 가장 오래된 항목 제거"""
+        self.router.RESULT_CACHE_SIZE = 2
+        for user_id in ('user1', 'user2', 'user3'):
+            self.router.route_command(user_id, ['상점'])
+
+        self.assertEqual(len(self.router._result_cache), 2)
+        self.assertNotIn(('user1', ('상점',)), self.router._result_cache)
+        self.assertIn(('user3', ('상점',)), self.router._result_cache)
+
+    def test_user_state_commands_not_cached(self):
+        """소지금처럼 사용자 상태를 보여주는 명령어는 캐시하지 않음"""
+        self.router.route_command('user1', ['소지금'])
+        self.router.route_command('user1', ['소지금'])
+
+        self.assertEqual(len(self.commands['money'].calls), 2)
+        self.assertEqual(len(self.router._result_cache), 0)
+
+    def test_write_command_invalidates_results(self):
+        """변경 명령어 실행 시 결과 캐시 무효화"""
+        self.router.route_command('user1', ['상점'])
+        self.assertTrue(self.router._result_cache)
+
+        self.router.route_command('user1', ['구매', '물약'])
+        self.assertFalse(self.router._result_cache)
+
+        self.router.route_command('user1', ['상점'])
+        self.assertEqual(len(self.commands['shop'].calls), 2)
+
+
+class TestWarmup(unittest.TestCase):
+    """라우터 초기화 시 미리 로드 테스트"""
+
+    def test_warmup_loads_only_core_commands(self):
+        """미리 로드는 핵심 명령어로 한정"""
+        router = CommandRouter()
+        self.assertLessEqual(set(router._command_instances), set(CommandRouter.WARMUP_COMMAND_TYPES))
+
+    def test_no_warmup_without_eager_load(self):
+        """eager_load=False 이면 아무것도 미리 만들지 않음"""
+        self.assertFalse(CommandRouter(eager_load=False)._command_instances)
+
+
+class TestResultConverters(unittest.TestCase):
+    """결과 문자열 변환 테스트"""
+
+    def test_result_converters_read_only(self):
+        """결과 변환 테이블은 라우팅 중 변경되지 않음"""
+        class Result:
+            def get_user_message(self):
+                return "메시지"
+
+        router = CommandRouter(eager_load=False)
+        self.assertEqual(router._convert_to_string(Result()), "메시지")
+        self.assertNotIn(Result, command_router._RESULT_CONVERTERS)
+        with self.assertRaises(TypeError):
+            command_router._RESULT_CONVERTERS[Result] = str
+
+    def test_sequence_results_use_first_item(self):
+        """튜플/리스트 결과는 첫 번째 항목으로 변환"""
+        router = CommandRouter(eager_load=False)
+        self.assertEqual(router._convert_to_string(("메시지", object())), "메시지")
+        self.assertEqual(router._convert_to_string(["메시지"]), "메시지")
+
+
+class TestUserLookup(RouterTestCase):
+    """사용자 조회 생략 테스트"""
+
+    def test_user_lookup_skipped_when_not_required(self):
+        """requires_user 가 False 인 명령어는 시트 조회 생략"""
+        self.router.route_command('user1', ['도움말'])
+        self.router.route_command('user1', ['2d6'])
+
+        self.sheets_manager.find_user_by_id_real_time.assert_not_called()
+        self.assertEqual(self.commands['dice'].calls[0].id, 'user1')
+
+    def test_user_lookup_when_required(self):
+        """requires_user 가 True 인 명령어는 시트에서 사용자 조회"""
+        self.router.route_command('user1', ['소지금'])
+
+        self.sheets_manager.find_user_by_id_real_time.assert_called_once_with('user1')
+        self.assertEqual(self.commands['money'].calls[0].name, '테스터')
+
+
+class TestUserCache(RouterTestCase):
+    """사용자 조회 캐시 테스트"""
+
+    def test_user_cache_reused_within_ttl(self):
+        """TTL 안의 연속 요청은 한 번만 조회"""
+        self.router.route_command('user1', ['소지금'])
+        self.router.route_command('user1', ['소지금'])
+        self.assertEqual(self.sheets_manager.find_user_by_id_real_time.call_count, 1)
+
+        self.clock.advance(CommandRouter.USER_CACHE_TTL)
+        self.router.route_command('user1', ['소지금'])
+        self.assertEqual(self.sheets_manager.find_user_by_id_real_time.call_count, 2)
+
+    def test_user_cache_evicts_oldest(self):
+        """최대 크기를 넘으면 가장 오래된 사용자 제거"""
+        self.router.USER_CACHE_SIZE = 2
+        for user_id in ('user1', 'user2', 'user3'):
+            self.router.route_command(user_id, ['소지금'])
+
+        self.assertEqual(list(self.router._user_cache), ['user2', 'user3'])
+
+    def test_write_command_refetches_user(self):
+        """변경 명령어는 캐시된 사용자를 쓰지 않고 다시 조회"""
+        self.router.route_command('user1', ['소지금'])
+        self.router.route_command('user1', ['구매', '물약'])
+
+        self.assertEqual(self.sheets_manager.find_user_by_id_real_time.call_count, 2)
+
+    def test_clear_command_cache_clears_all_caches(self):
+        """clear_command_cache 는 인스턴스와 모든 조회 캐시를 비움"""
+        for keywords in (['상점'], ['소지금'], ['2d6'], ['인사']):
+            self.router.route_command('user1', keywords)
+
+        self.router.clear_command_cache()
+
+        self.assertFalse(self.router._command_instances)
+        self.assertFalse(self.router._exact_matches)
+        self.assertFalse(self.router._match_cache)
+        self.assertFalse(self.router._result_cache)
+        self.assertFalse(self.router._user_cache)
+        self.assertEqual(self.router._custom_cmds_cache, (0.0, None, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
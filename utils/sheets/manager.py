@@ -209,84 +209,77 @@ class SheetsManager:
         try:
             worksheet_name = config.get_worksheet_name('FORTUNE')
             data = self.read_worksheet_real_time(worksheet_name)
-            
-            if not data:
-                return []
-            
-            # 운세 문구 추출
-            fortune_phrases = []
-            for row in data:
-                if isinstance(row, dict):
-                    phrase = str(row.get('문구', '')).strip()
-                else:
-                    # 리스트 형태인 경우 첫 번째 요소 사용
-                    phrase = str(row[0] if len(row) > 0 else '').strip()
-                
-                if phrase:
-                    fortune_phrases.append(phrase)
-            
-            return fortune_phrases
+            return self.extract_fortune_phrases(data)
             
         except Exception as e:
             logger.error(f"운세 문구 조회 실패: {e}")
             return []
     
+    @staticmethod
+    def extract_fortune_phrases(data: List[Any]) -> List[str]:
+        """워크시트 데이터에서 운세 문구 추출"""
+        fortune_phrases = []
+        for row in data or []:
+            if isinstance(row, dict):
+                phrase = str(row.get('문구', '')).strip()
+            else:
+                # 리스트 형태인 경우 첫 번째 요소 사용
+                phrase = str(row[0] if len(row) > 0 else '').strip()
+            
+            if phrase:
+                fortune_phrases.append(phrase)
+        
+        return fortune_phrases
+    
     def get_help_items(self) -> List[Dict[str, str]]:
         """도움말 항목 조회 (실시간)"""
         try:
             worksheet_name = config.get_worksheet_name('HELP')
             data = self.read_worksheet_real_time(worksheet_name)
-            
-            if not data:
-                return []
-            
-            # 도움말 항목 추출
-            help_items = []
-            for row in data:
-                if isinstance(row, dict):
-                    command = str(row.get('명령어', '')).strip()
-                    description = str(row.get('설명', '')).strip()
-                else:
-                    # 리스트 형태인 경우 첫 번째와 두 번째 요소 사용
-                    command = str(row[0] if len(row) > 0 else '').strip()
-                    description = str(row[1] if len(row) > 1 else '').strip()
-                
-                if command and description:
-                    help_items.append({
-                        'command': command,
-                        'description': description
-                    })
-            
-            return help_items
+            return self.extract_help_items(data)
             
         except Exception as e:
             logger.error(f"도움말 항목 조회 실패: {e}")
             return []
     
+    @staticmethod
+    def extract_help_items(data: List[Any]) -> List[Dict[str, str]]:
+        """워크시트 데이터에서 도움말 항목 추출"""
+        help_items = []
+        for row in data or []:
+            if isinstance(row, dict):
+                command = str(row.get('명령어', '')).strip()
+                description = str(row.get('설명', '')).strip()
+            else:
+                # 리스트 형태인 경우 첫 번째와 두 번째 요소 사용
+                command = str(row[0] if len(row) > 0 else '').strip()
+                description = str(row[1] if len(row) > 1 else '').strip()
+            
+            if command and description:
+                help_items.append({
+                    'command': command,
+                    'description': description
+                })
+        
+        return help_items
+    
     def batch_read_worksheets(self, worksheet_names: List[str]) -> Dict[str, List[Dict[str, Any]]]:
-        """여러 워크시트 배치 읽기"""
+        """여러 워크시트를 한 번의 API 호출(values.batchGet)로 배치 읽기"""
         start_time = time.time()
-        results = {}
         
         try:
-            for worksheet_name in worksheet_names:
-                try:
-                    data = self.read_worksheet_real_time(worksheet_name)
-                    results[worksheet_name] = data
-                except Exception as e:
-                    logger.warning(f"배치 읽기 실패: {worksheet_name} - {e}")
-                    results[worksheet_name] = []
+            results = self.operations.batch_read_worksheets(worksheet_names)
             
             duration = time.time() - start_time
             self.performance.record_operation("batch_read", duration)
             
             logger.info(f"배치 읽기 완료: {len(worksheet_names)}개 시트")
-            return results
+            return {name: results.get(name, []) for name in worksheet_names}
             
         except Exception as e:
             self.performance.record_error()
-            logger.error(f"배치 읽기 실패: {e}")
-            return {}
+            logger.error(f"배치 읽기 실패: {worksheet_names} - {e}")
+            return {name: [] for name in worksheet_names}
     
     def get_performance_stats(self) -> Dict[str, Any]:
         """성능 통계 반환"""
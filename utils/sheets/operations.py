@@ -5,6 +5,7 @@ Google Sheets 기본 작업 모듈
 
 import time
 from typing import List, Dict, Any, Optional
+from gspread.utils import absolute_range_name
 from .interfaces import SheetsOperations
 from .connection import GoogleSheetsConnection
 from utils.error_handling import safe_execute, ErrorContext
@@ -47,6 +48,40 @@ class GoogleSheetsOperations(SheetsOperations):
                 bot_logger.log_sheet_operation("워크시트 읽기", name, False, str(result.error))
                 return []
     
+    def batch_read_worksheets(self, names: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """여러 워크시트를 한 번의 API 호출(values.batchGet)로 읽기"""
+        def batch_read_operation():
+            spreadsheet = self.connection.connect()
+            response = spreadsheet.values_batch_get(
+                [absolute_range_name(name) for name in names]
+            )
+            self._operation_count += 1
+            
+            results = {}
+            value_ranges = response.get('valueRanges', [])
+            for name, value_range in zip(names, value_ranges):
+                rows = value_range.get('values', [])
+                if len(rows) <= 1:  # 헤더만 있거나 빈 시트
+                    results[name] = []
+                    continue
+                
+                headers = rows[0]
+                header_count = len(headers)
+                results[name] = [
+                    dict(zip(headers, row + [''] * (header_count - len(row))))
+                    for row in rows[1:]
+                ]
+            return results
+        
+        with ErrorContext("워크시트 배치 읽기", additional_data={"worksheets": names}):
+            result = safe_execute("워크시트 배치 읽기", fallback_result={})(batch_read_operation)
+            
+            for name in names:
+                bot_logger.log_sheet_operation("워크시트 배치 읽기", name, result.success,
+                                             str(result.error) if not result.success else None)
+            
+            return result.result if result.success else {}
+    
     def write_worksheet(self, name: str, data: List[Dict[str, Any]]) -> bool:
         """워크시트 쓰기"""
         def write_operation():